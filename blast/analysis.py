@@ -1,4 +1,5 @@
-from blast.bit import Reference, Bit, BitMutable
+from blast import graph
+from blast.bit import Reference, Bit
 from blast.bitvector import BitVector
 
 
@@ -31,14 +32,11 @@ class BitVectorAnalysis(object):
         :return:
         """
         inputs = set()
-        for i in range(len(self.bit_vector)):
-            bit = self.bit_vector.bit(i)
-            for reference in bit.inputs():
-                if not isinstance(reference.value, BitMutable):
-                    continue
-                if reference.value.is_concrete():
-                    continue
-                inputs.add(reference)
+        bits = [self.bit_vector.bit(i) for i in range(len(self.bit_vector))]
+        for bit in graph.inputs(bits):
+            if bit.is_concrete():
+                continue
+            inputs.add(Reference(bit))
         return sorted(inputs)
 
     def outputs(self) -> set[Reference]:
@@ -1,6 +1,7 @@
 import sys
 
 from typing import Self
+from blast import graph
 from blast.bit import Bit, BitMutable, BIT_1, BIT_0
 
 
@@ -41,6 +42,18 @@ class BitVector(object):
         bv[0:length] = value
         return bv
 
+    @staticmethod
+    def concatenate(*bit_vectors: 'BitVector'):
+        """
+        Create a new bit-vector consisting of the bits of the given bit-vectors, in order.
+        :param bit_vectors:
+        :return:
+        """
+        bits = []
+        for bit_vector in bit_vectors:
+            bits.extend(bit_vector._bits)
+        return BitVector(bits)
+
     def bit(self, index: int) -> Bit:
         """
         Returns the bit at the given index.
@@ -134,10 +147,7 @@ class BitVector(object):
         :param bits: Amount of bits to check
         :return: True if all bits are concrete, False otherwise
         """
-        for bit in self._bits[bit_start_inclusive:bit_start_inclusive + bits]:
-            if not bit.is_concrete():
-                return False
-        return True
+        return graph.is_concrete(self._bits[bit_start_inclusive:bit_start_inclusive + bits])
 
     def __int__(self) -> int:
         """
@@ -145,9 +155,9 @@ class BitVector(object):
         :return:
         """
         value = 0
-        for i in range(len(self._bits)):
+        for bit_value in graph.evaluate(self._bits):
             value <<= 1
-            value |= int(self._bits[i])
+            value |= bit_value
         return value
 
     def __str__(self) -> str:
@@ -270,7 +280,7 @@ class BitVector(object):
             return BitVector.mutable_from_int(int(self) + int(other), len(self))
         bv = self[:]
         carry = BIT_0
-        for i in range(len(bv._bits)):
+        for i in reversed(range(len(bv._bits))):
             bv._bits[i], carry = Bit.add(bv._bits[i], other._bits[i], carry)
         return bv
 
@@ -0,0 +1,217 @@
+import hashlib
+import io
+import os
+import time
+import typing
+
+from blast.analysis import BitVectorAnalysis
+from blast.bit import BitExpression, Reference
+from blast.bitvector import BitVector
+from blast.optimize import BitExpressionOptimization
+from blast.serialize.flat import BitVectorFlatSerializer, BitVectorFlatDeserializer
+
+CACHE_DIRECTORY = os.environ.get("BLAST_CACHE_DIRECTORY", os.path.join(os.path.expanduser("~"), ".cache", "blast"))
+CACHE_SIZE = 256 * 1024 * 1024
+CACHE_SUFFIX = ".flat"
+CACHE_VERSION = 2
+"""
+Version of the cache entries and of the circuit builders, part of every key.
+Bump this whenever the entry format or the circuit built by any builder changes, such that stale entries are no longer served.
+"""
+CACHE_SKIP = "skip\n"
+"""
+Entry content marking a circuit which is cheaper to rebuild than to load.
+"""
+CACHE_OPTIMIZE_INPUTS = 12
+"""
+Output bits depending on at most this many inputs are optimized before being stored.
+"""
+
+
+class BitVectorCache(object):
+    """
+    A content-addressed on-disk cache of serialized circuits.
+
+    Entries are keyed by circuit kind, source length, the mask and values of the known source bits and the pattern in
+    which unknown source bits alias each other. Circuits are optimized before being stored. Circuits which load slower
+    than they build are not stored, instead a marker is stored such that later builds skip the cache. Once the total
+    size of the cache exceeds its bound the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str = CACHE_DIRECTORY, size: int = CACHE_SIZE):
+        """
+        :param directory: Directory in which entries are stored, created on first write.
+        :param size: Maximum total size of all entries, in bytes.
+        """
+        self.directory = directory
+        self.size = size
+
+    @staticmethod
+    def key(kind: str, source: BitVector, *parameters) -> str | None:
+        """
+        Returns the key of a circuit of the given kind built from the given source.
+        Sources containing expressions can not be described by a mask of known bits, for these None is returned.
+        :param kind: Kind of circuit, i.e. "gamma0".
+        :param source: Source bit vector from which the circuit is built.
+        :param parameters: Any further parameters which affect the built circuit.
+        :return:
+        """
+        mask = 0
+        value = 0
+        aliases: dict[Reference, int] = dict()
+        pattern = []
+        for i in range(len(source)):
+            bit = source.bit(i)
+            if isinstance(bit, BitExpression):
+                return None
+            mask <<= 1
+            value <<= 1
+            if bit.is_concrete():
+                mask |= 1
+                value |= int(bit)
+            else:
+                pattern.append(str(aliases.setdefault(Reference(bit), len(aliases))))
+        description = ":".join([str(CACHE_VERSION), kind, str(len(source)), f"{mask:x}", f"{value:x}", ",".join(pattern)]
+                               + [str(p) for p in parameters])
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def _entries(self) -> list[tuple[str, int]]:
+        """
+        Returns the path and size of all entries of this cache, least recently used first.
+        Entries removed by another process while listing are left out.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(CACHE_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        entries.sort()
+        return [(path, size) for _, path, size in entries]
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the serialized circuit stored under the given key, marking it as most recently used.
+        :param key:
+        :return: The serialized circuit, or None if absent.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r") as stream:
+                text = stream.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return text
+
+    def put(self, key: str, text: str):
+        """
+        Stores a serialized circuit under the given key, then evicts entries until the cache fits its bound.
+        :param key:
+        :param text:
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        path_temporary = f"{path}.{os.getpid()}.tmp"
+        with open(path_temporary, "w") as stream:
+            stream.write(text)
+        os.replace(path_temporary, path)
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the total size of the cache is within its bound.
+        """
+        entries = self._entries()
+        total = sum(size for _, size in entries)
+        for path, size in entries:
+            if total <= self.size:
+                break
+            total -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        for path, _ in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def usage(self) -> tuple[int, int]:
+        """
+        Returns the number of entries and their total size in bytes.
+        """
+        entries = self._entries()
+        return len(entries), sum(size for _, size in entries)
+
+    @staticmethod
+    def _optimize(bit_vector: BitVector) -> BitVector:
+        """
+        Optimizes each bit of the given bit vector whose cone is small enough to be enumerated.
+        """
+        optimized = bit_vector[:]
+        for i in range(len(optimized)):
+            bit = optimized.bit(i)
+            if not isinstance(bit, BitExpression):
+                continue
+            if len(BitVectorAnalysis.for_bit(bit).inputs()) > CACHE_OPTIMIZE_INPUTS:
+                continue
+            bit_optimized = BitExpressionOptimization.fix_inputs(bit)
+            if bit_optimized is not None:
+                optimized[i] = bit_optimized
+        return optimized
+
+    def build(self, kind: str, source: BitVector, build: typing.Callable[[BitVector], BitVector], *parameters) -> BitVector:
+        """
+        Builds a circuit from the given source, loading it from the cache when it was built before.
+
+        Entries store the source followed by the circuit as a single bit vector, such that the unknown bits of a given
+        source can be bound to the leading positions of a loaded entry and remain inputs of the loaded circuit.
+        :param kind: Kind of circuit, i.e. "gamma0".
+        :param source: Source bit vector from which the circuit is built.
+        :param build: Function building the circuit from the source.
+        :param parameters: Any further parameters which affect the built circuit.
+        :return:
+        """
+        key = BitVectorCache.key(kind, source, *parameters)
+        if key is None:
+            return build(source)
+        text = self.get(key)
+        if text == CACHE_SKIP:
+            return BitVectorCache._optimize(build(source))
+        if text is not None:
+            return BitVectorCache._load(text, source)
+        time_start = time.perf_counter()
+        result = BitVectorCache._optimize(build(source))
+        time_build = time.perf_counter() - time_start
+        stream = io.StringIO()
+        BitVectorFlatSerializer.serialize(BitVector.concatenate(source, result), stream)
+        text = stream.getvalue()
+        time_start = time.perf_counter()
+        BitVectorCache._load(text, source)
+        time_load = time.perf_counter() - time_start
+        self.put(key, text if time_load < time_build else CACHE_SKIP)
+        return result
+
+    @staticmethod
+    def _load(text: str, source: BitVector) -> BitVector:
+        bindings = dict()
+        for i in range(len(source)):
+            if not source.bit(i).is_concrete():
+                bindings[i] = source.bit(i)
+        combined = BitVectorFlatDeserializer.deserialize(io.StringIO(text), bindings)
+        return combined[len(source):]
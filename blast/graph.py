@@ -0,0 +1,75 @@
+from blast.bit import Bit, BitMutable, BitExpression
+
+
+def topological(bits: list[Bit]) -> list[Bit]:
+    """
+    Returns the given bits and all bits they depend on, each once.
+    The list is ordered such that each bit only depends on bits that appear before it in the list.
+    Walks the graph iteratively such that shared bits are visited once and deep graphs do not exhaust the stack.
+    :param bits:
+    :return:
+    """
+    seen: set[int] = set()
+    ordered: list[Bit] = []
+    stack: list[tuple[Bit, bool]] = [(bit, False) for bit in reversed(bits)]
+    while stack:
+        bit, expanded = stack.pop()
+        if expanded:
+            ordered.append(bit)
+            continue
+        if id(bit) in seen:
+            continue
+        seen.add(id(bit))
+        stack.append((bit, True))
+        for dependency in reversed(list(bit.dependencies())):
+            if id(dependency) not in seen:
+                stack.append((dependency, False))
+    return ordered
+
+
+def inputs(bits: list[Bit]) -> list[BitMutable]:
+    """
+    Returns the distinct mutable bits which the given bits depend on, in order of first appearance.
+    :param bits:
+    :return:
+    """
+    return [bit for bit in topological(bits) if isinstance(bit, BitMutable)]
+
+
+def is_concrete(bits: list[Bit]) -> bool:
+    """
+    Checks if all given bits are concrete, visiting every shared bit at most once.
+    :param bits:
+    :return:
+    """
+    seen: set[int] = set()
+    stack = list(bits)
+    while stack:
+        bit = stack.pop()
+        if id(bit) in seen:
+            continue
+        seen.add(id(bit))
+        if isinstance(bit, BitExpression):
+            stack.extend(bit.dependencies())
+        elif not bit.is_concrete():
+            return False
+    return True
+
+
+def evaluate(bits: list[Bit]) -> list[int]:
+    """
+    Returns the values of the given bits, evaluating every shared bit once.
+    :param bits:
+    :return:
+    """
+    values: dict[int, int] = dict()
+    for bit in topological(bits):
+        if isinstance(bit, BitExpression):
+            index = 0
+            for dependency in reversed(bit.dependencies()):
+                index <<= 1
+                index |= values[id(dependency)] & 1
+            values[id(bit)] = bit.gate[index]
+        else:
+            values[id(bit)] = int(bit)
+    return [values[id(bit)] for bit in bits]
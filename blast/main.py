@@ -2,6 +2,7 @@ import sys
 import typing
 
 from blast.analysis import BitVectorAnalysis
+from blast.cache import BitVectorCache, CACHE_DIRECTORY, CACHE_SIZE
 from blast.sha256.constants import SIZE_WORD
 from blast.sha256.functions import gamma0, gamma1, sigma0, sigma1
 from blast.bitvector import BitVector
@@ -9,41 +10,45 @@ from blast.serialize.serializer import BitVectorSerializer, BitVectorDeserialize
 
 
 class SubcommandDump(object):
-    def __init__(self, source: BitVector, stream: typing.IO):
+    def __init__(self, source: BitVector, stream: typing.IO, cache: BitVectorCache | None):
         self._source = source
         self._stream = stream
+        self._cache = cache
 
-    def gamma0(self):
+    def _dump_word_function(self, kind: str, function: typing.Callable[[BitVector], BitVector]):
         """
-        Serialize the gamma0 function.
+        Serialize a function applied to the source, or to an unknown word if no source is provided.
         """
         source = self._source if self._source is not None else BitVector.mutable(SIZE_WORD)
-        bitvector = gamma0(source)
+        if self._cache is not None:
+            bitvector = self._cache.build(kind, source, function)
+        else:
+            bitvector = function(source)
         BitVectorSerializer.serialize(bitvector, self._stream)
 
+    def gamma0(self):
+        """
+        Serialize the gamma0 function.
+        """
+        self._dump_word_function("gamma0", gamma0)
+
     def gamma1(self):
         """
         Serialize the gamma1 function.
         """
-        source = self._source if self._source is not None else BitVector.mutable(SIZE_WORD)
-        bitvector = gamma1(source)
-        BitVectorSerializer.serialize(bitvector, self._stream)
+        self._dump_word_function("gamma1", gamma1)
 
     def sigma0(self):
         """
         Serialize the sigma0 function.
         """
-        source = self._source if self._source is not None else BitVector.mutable(SIZE_WORD)
-        bitvector = sigma0(source)
-        BitVectorSerializer.serialize(bitvector, self._stream)
+        self._dump_word_function("sigma0", sigma0)
 
     def sigma1(self):
         """
         Serialize the sigma1 function.
         """
-        source = self._source if self._source is not None else BitVector.mutable(SIZE_WORD)
-        bitvector = sigma1(source)
-        BitVectorSerializer.serialize(bitvector, self._stream)
+        self._dump_word_function("sigma1", sigma1)
 
     def bit(self, index: int):
         """
@@ -70,11 +75,47 @@ class SubcommandAnalysis(object):
             print(f"- {analysis_bit.compute()}")
 
 
+class SubcommandCache(object):
+    def __init__(self, cache: BitVectorCache, stream: typing.IO):
+        self._cache = cache
+        self._stream = stream
+
+    def clear(self):
+        """
+        Remove all cached circuits.
+        """
+        self._cache.clear()
+
+    def info(self):
+        """
+        Print the location, number of entries and size of the circuit cache.
+        """
+        entries, size = self._cache.usage()
+        print(f"directory: {self._cache.directory}", file=self._stream)
+        print(f"entries: {entries}", file=self._stream)
+        print(f"size: {size}", file=self._stream)
+        print(f"size_limit: {self._cache.size}", file=self._stream)
+
+
 class CLI(object):
 
-    def __init__(self, infile: str = "-", outfile: str = "-"):
+    def __init__(self,
+                 infile: str = "-",
+                 outfile: str = "-",
+                 cache: bool = True,
+                 cache_directory: str = CACHE_DIRECTORY,
+                 cache_size: int = CACHE_SIZE):
+        """
+        :param infile: File to read a serialized bit vector from, "-" for stdin.
+        :param outfile: File to write output to, "-" for stdout.
+        :param cache: Whether to load and store built circuits in the circuit cache, disable with --nocache.
+        :param cache_directory: Directory of the circuit cache.
+        :param cache_size: Maximum size of the circuit cache, in bytes.
+        """
         input_stream = sys.stdin if infile == "-" else open(infile, "r")
         output_stream = sys.stdout if outfile == "-" else open(outfile, "w")
         source = None if input_stream.isatty() else BitVectorDeserializer.deserialize(input_stream)
-        self.dump = SubcommandDump(source, output_stream)
+        circuit_cache = BitVectorCache(cache_directory, cache_size)
+        self.dump = SubcommandDump(source, output_stream, circuit_cache if cache else None)
         self.analysis = SubcommandAnalysis(source, output_stream)
+        self.cache = SubcommandCache(circuit_cache, output_stream)
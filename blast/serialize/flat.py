@@ -0,0 +1,78 @@
+from blast import graph
+from blast.bit import Bit, BitMutable, BitImmutable, BitExpression, Reference, BIT_0, BIT_1
+from blast.bitvector import BitVector
+from blast.serialize.serializer import BitVectorSerializer, BitVectorDeserializer
+
+FLAT_HEADER = "blast-flat 1"
+
+
+class BitVectorFlatSerializer(object):
+    """
+    Writes bit vectors in a flat line-based format which is compact and cheap to parse.
+
+    After a header line, each line describes one bit, identified by its line number starting from 0;
+    "?" is an unknown bit, "0" and "1" are concrete bits and "g <gate> <dependencies...>" is an expression whose
+    gate is encoded as by BitVectorSerializer.encode_gate. A final line "= <identifiers...>" lists the bit vector.
+    """
+
+    @staticmethod
+    def serialize(bit_vector: BitVector, stream):
+        """
+        Writes a flat representation of the bit vector to the given stream.
+        :param bit_vector:
+        :param stream:
+        """
+        bits = [bit_vector.bit(i) for i in range(len(bit_vector))]
+        identifiers: dict[Reference, int] = dict()
+        lines = [FLAT_HEADER]
+        for bit in graph.topological(bits):
+            identifiers[Reference(bit)] = len(identifiers)
+            if isinstance(bit, BitExpression):
+                dependencies = " ".join(str(identifiers[Reference(dependency)]) for dependency in bit.dependencies())
+                lines.append(f"g {BitVectorSerializer.encode_gate(bit.gate)} {dependencies}")
+            elif isinstance(bit, (BitMutable, BitImmutable)):
+                lines.append(str(int(bit)) if bit.is_concrete() else "?")
+            else:
+                raise Exception(f"Bit implementation unknown to serializer: {type(bit)}")
+        lines.append("= " + " ".join(str(identifiers[Reference(bit)]) for bit in bits))
+        stream.write("\n".join(lines))
+        stream.write("\n")
+
+
+class BitVectorFlatDeserializer(object):
+    @staticmethod
+    def deserialize(stream, bindings: dict[int, Bit] | None = None) -> BitVector:
+        """
+        Reads a flat representation of a bit vector from the given stream.
+        :param stream:
+        :param bindings: Bits to use in place of the serialized bits at the given positions of the bit vector,
+                         for example to keep the unknown bits of a source as inputs of a circuit built from it.
+        :return:
+        """
+        lines = stream.read().splitlines()
+        if not lines or lines[0] != FLAT_HEADER:
+            raise ValueError("Stream does not contain a flat bit vector")
+        outputs = [int(identifier) for identifier in lines[-1].split()[1:]]
+        bits_bound = dict()
+        if bindings is not None:
+            for position, bit in bindings.items():
+                bits_bound[outputs[position]] = bit
+        gates: dict[tuple[int, int], list[int]] = dict()
+        bits: list[Bit] = []
+        for identifier, line in enumerate(lines[1:-1]):
+            if identifier in bits_bound:
+                bits.append(bits_bound[identifier])
+            elif line == "?":
+                bits.append(BitMutable())
+            elif line == "0":
+                bits.append(BIT_0)
+            elif line == "1":
+                bits.append(BIT_1)
+            else:
+                fields = line.split()
+                dependencies = [bits[int(dependency)] for dependency in fields[2:]]
+                gate_key = (int(fields[1]), len(dependencies))
+                if gate_key not in gates:
+                    gates[gate_key] = BitVectorDeserializer.decode_gate(*gate_key)
+                bits.append(BitExpression(gates[gate_key], *dependencies))
+        return BitVector([bits[identifier] for identifier in outputs])
@@ -50,8 +50,11 @@ class BitVectorSerializer(object):
 
         expressions_bitvector = []
         for i in range(len(bit_vector)):
-            top_id = collect(bit_vector.bit(i))
-            expressions_bitvector.append(top_id)
+            top_reference = Reference(bit_vector.bit(i))
+            if top_reference in expressions_seen:
+                expressions_bitvector.append(expressions_seen[top_reference])
+            else:
+                expressions_bitvector.append(collect(bit_vector.bit(i)))
 
         return expressions_ordered, expressions_bitvector
 
@@ -108,7 +111,7 @@ class BitVectorDeserializer(object):
         :return:
         """
         value = []
-        for i in range(input_bits ** 2):
+        for i in range(2 ** input_bits):
             value.append(gate & 1)
             gate >>= 1
         return list(reversed(value))
@@ -122,7 +125,7 @@ class BitVectorDeserializer(object):
         """
         bit_id = bit_yaml['id']
         if 'value' in bit_yaml:
-            bit = BitImmutable(bit_yaml['value'])
+            bit = BitImmutable(int(bit_yaml['value']))
             return BitIdentified(bit, bit_id, [])
         if 'gate' in bit_yaml:
             input_bits = len(bit_yaml['dependencies'])
@@ -138,12 +141,16 @@ class BitVectorDeserializer(object):
         return BitIdentified(bit, bit_id, [])
 
     @staticmethod
-    def deserialize(stream) -> BitVector:
+    def deserialize(stream) -> BitVector | None:
         """
         Reads a YAML representation of a bit vector from the given stream.
+        :param stream:
+        :return: The bit vector, or None if the stream is empty.
         """
         yaml = YAML()
         data = yaml.load(stream)
+        if data is None:
+            return None
         bits_yaml = data['bits']
         bits_mapped = dict()
         for bit_yaml in bits_yaml:
@@ -0,0 +1,82 @@
+from blast.sha256.constants import MAGIC_FRACTIONS_CUBE, SIZE_WORD
+
+MASK_WORD = (1 << SIZE_WORD) - 1
+
+
+def rotate_right(x: int, amount: int) -> int:
+    """
+    Rotates a 32-bit word right by the given amount of bits.
+    """
+    return ((x >> amount) | (x << (SIZE_WORD - amount))) & MASK_WORD
+
+
+def gamma0(x: int) -> int:
+    """
+    Gamma 0 function as defined in the SHA256 standard, on a concrete word.
+    """
+    return rotate_right(x, 7) ^ rotate_right(x, 18) ^ (x >> 3)
+
+
+def gamma1(x: int) -> int:
+    """
+    Gamma 1 function as defined in the SHA256 standard, on a concrete word.
+    """
+    return rotate_right(x, 17) ^ rotate_right(x, 19) ^ (x >> 10)
+
+
+def sigma0(x: int) -> int:
+    """
+    Sigma 0 function as defined in the SHA256 standard, on a concrete word.
+    """
+    return rotate_right(x, 2) ^ rotate_right(x, 13) ^ rotate_right(x, 22)
+
+
+def sigma1(x: int) -> int:
+    """
+    Sigma 1 function as defined in the SHA256 standard, on a concrete word.
+    """
+    return rotate_right(x, 6) ^ rotate_right(x, 11) ^ rotate_right(x, 25)
+
+
+def choose(x: int, y: int, z: int) -> int:
+    """
+    'Ch' function as defined in the SHA256 standard, on concrete words.
+    """
+    return z ^ (x & (y ^ z))
+
+
+def majority(x: int, y: int, z: int) -> int:
+    """
+    'Maj' function as defined in the SHA256 standard, on concrete words.
+    """
+    return ((x | y) & z) | (x & y)
+
+
+def init_words(block: int) -> list[int]:
+    """
+    Builds the list of 64 32-bit words used in the SHA256 algorithm.
+
+    :param block: 512-bit block, its first word being the most significant
+    :return:
+    """
+    w = [(block >> (SIZE_WORD * (15 - i))) & MASK_WORD for i in range(16)]
+    for wi in range(16, 64):
+        w.append((gamma1(w[wi - 2]) + w[wi - 7] + gamma0(w[wi - 15]) + w[wi - 16]) & MASK_WORD)
+    return w
+
+
+def transform(digest: list[int], block: int) -> list[int]:
+    """
+    Compresses a 512-bit block into the given digest, returning the new digest.
+
+    :param digest: 8 32-bit words of the current digest
+    :param block: 512-bit block, its first word being the most significant
+    :return:
+    """
+    w = init_words(block)
+    a, b, c, d, e, f, g, h = digest
+    for i in range(64):
+        t1 = (h + sigma1(e) + choose(e, f, g) + MAGIC_FRACTIONS_CUBE[i] + w[i]) & MASK_WORD
+        t2 = (sigma0(a) + majority(a, b, c)) & MASK_WORD
+        a, b, c, d, e, f, g, h = (t1 + t2) & MASK_WORD, a, b, c, (d + t1) & MASK_WORD, e, f, g
+    return [(x + y) & MASK_WORD for x, y in zip(digest, [a, b, c, d, e, f, g, h])]
@@ -2,80 +2,84 @@ from blast.bitvector import BitVector
 
 SIZE_WORD = 32
 
-MAGIC_FRACTIONS_BITVECTOR_SQUARE = [
-    BitVector.mutable_from_int(0x6a09e667, 32),
-    BitVector.mutable_from_int(0xbb67ae85, 32),
-    BitVector.mutable_from_int(0x3c6ef372, 32),
-    BitVector.mutable_from_int(0xa54ff53a, 32),
-    BitVector.mutable_from_int(0x510e527f, 32),
-    BitVector.mutable_from_int(0x9b05688c, 32),
-    BitVector.mutable_from_int(0x1f83d9ab, 32),
-    BitVector.mutable_from_int(0x5be0cd19, 32)
+MAGIC_FRACTIONS_SQUARE = [
+    0x6a09e667,
+    0xbb67ae85,
+    0x3c6ef372,
+    0xa54ff53a,
+    0x510e527f,
+    0x9b05688c,
+    0x1f83d9ab,
+    0x5be0cd19
 ]
 
-MAGIC_FRACTIONS_BITVECTOR_CUBE = [
-    BitVector.mutable_from_int(0x428a2f98, 32),
-    BitVector.mutable_from_int(0x71374491, 32),
-    BitVector.mutable_from_int(0xb5c0fbcf, 32),
-    BitVector.mutable_from_int(0xe9b5dba5, 32),
-    BitVector.mutable_from_int(0x3956c25b, 32),
-    BitVector.mutable_from_int(0x59f111f1, 32),
-    BitVector.mutable_from_int(0x923f82a4, 32),
-    BitVector.mutable_from_int(0xab1c5ed5, 32),
-    BitVector.mutable_from_int(0xd807aa98, 32),
-    BitVector.mutable_from_int(0x12835b01, 32),
-    BitVector.mutable_from_int(0x243185be, 32),
-    BitVector.mutable_from_int(0x550c7dc3, 32),
-    BitVector.mutable_from_int(0x72be5d74, 32),
-    BitVector.mutable_from_int(0x80deb1fe, 32),
-    BitVector.mutable_from_int(0x9bdc06a7, 32),
-    BitVector.mutable_from_int(0xc19bf174, 32),
-    BitVector.mutable_from_int(0xe49b69c1, 32),
-    BitVector.mutable_from_int(0xefbe4786, 32),
-    BitVector.mutable_from_int(0x0fc19dc6, 32),
-    BitVector.mutable_from_int(0x240ca1cc, 32),
-    BitVector.mutable_from_int(0x2de92c6f, 32),
-    BitVector.mutable_from_int(0x4a7484aa, 32),
-    BitVector.mutable_from_int(0x5cb0a9dc, 32),
-    BitVector.mutable_from_int(0x76f988da, 32),
-    BitVector.mutable_from_int(0x983e5152, 32),
-    BitVector.mutable_from_int(0xa831c66d, 32),
-    BitVector.mutable_from_int(0xb00327c8, 32),
-    BitVector.mutable_from_int(0xbf597fc7, 32),
-    BitVector.mutable_from_int(0xc6e00bf3, 32),
-    BitVector.mutable_from_int(0xd5a79147, 32),
-    BitVector.mutable_from_int(0x06ca6351, 32),
-    BitVector.mutable_from_int(0x14292967, 32),
-    BitVector.mutable_from_int(0x27b70a85, 32),
-    BitVector.mutable_from_int(0x2e1b2138, 32),
-    BitVector.mutable_from_int(0x4d2c6dfc, 32),
-    BitVector.mutable_from_int(0x53380d13, 32),
-    BitVector.mutable_from_int(0x650a7354, 32),
-    BitVector.mutable_from_int(0x766a0abb, 32),
-    BitVector.mutable_from_int(0x81c2c92e, 32),
-    BitVector.mutable_from_int(0x92722c85, 32),
-    BitVector.mutable_from_int(0xa2bfe8a1, 32),
-    BitVector.mutable_from_int(0xa81a664b, 32),
-    BitVector.mutable_from_int(0xc24b8b70, 32),
-    BitVector.mutable_from_int(0xc76c51a3, 32),
-    BitVector.mutable_from_int(0xd192e819, 32),
-    BitVector.mutable_from_int(0xd6990624, 32),
-    BitVector.mutable_from_int(0xf40e3585, 32),
-    BitVector.mutable_from_int(0x106aa070, 32),
-    BitVector.mutable_from_int(0x19a4c116, 32),
-    BitVector.mutable_from_int(0x1e376c08, 32),
-    BitVector.mutable_from_int(0x2748774c, 32),
-    BitVector.mutable_from_int(0x34b0bcb5, 32),
-    BitVector.mutable_from_int(0x391c0cb3, 32),
-    BitVector.mutable_from_int(0x4ed8aa4a, 32),
-    BitVector.mutable_from_int(0x5b9cca4f, 32),
-    BitVector.mutable_from_int(0x682e6ff3, 32),
-    BitVector.mutable_from_int(0x748f82ee, 32),
-    BitVector.mutable_from_int(0x78a5636f, 32),
-    BitVector.mutable_from_int(0x84c87814, 32),
-    BitVector.mutable_from_int(0x8cc70208, 32),
-    BitVector.mutable_from_int(0x90befffa, 32),
-    BitVector.mutable_from_int(0xa4506ceb, 32),
-    BitVector.mutable_from_int(0xbef9a3f7, 32),
-    BitVector.mutable_from_int(0xc67178f2, 32)
+MAGIC_FRACTIONS_BITVECTOR_SQUARE = [BitVector.mutable_from_int(value, SIZE_WORD) for value in MAGIC_FRACTIONS_SQUARE]
+
+MAGIC_FRACTIONS_CUBE = [
+    0x428a2f98,
+    0x71374491,
+    0xb5c0fbcf,
+    0xe9b5dba5,
+    0x3956c25b,
+    0x59f111f1,
+    0x923f82a4,
+    0xab1c5ed5,
+    0xd807aa98,
+    0x12835b01,
+    0x243185be,
+    0x550c7dc3,
+    0x72be5d74,
+    0x80deb1fe,
+    0x9bdc06a7,
+    0xc19bf174,
+    0xe49b69c1,
+    0xefbe4786,
+    0x0fc19dc6,
+    0x240ca1cc,
+    0x2de92c6f,
+    0x4a7484aa,
+    0x5cb0a9dc,
+    0x76f988da,
+    0x983e5152,
+    0xa831c66d,
+    0xb00327c8,
+    0xbf597fc7,
+    0xc6e00bf3,
+    0xd5a79147,
+    0x06ca6351,
+    0x14292967,
+    0x27b70a85,
+    0x2e1b2138,
+    0x4d2c6dfc,
+    0x53380d13,
+    0x650a7354,
+    0x766a0abb,
+    0x81c2c92e,
+    0x92722c85,
+    0xa2bfe8a1,
+    0xa81a664b,
+    0xc24b8b70,
+    0xc76c51a3,
+    0xd192e819,
+    0xd6990624,
+    0xf40e3585,
+    0x106aa070,
+    0x19a4c116,
+    0x1e376c08,
+    0x2748774c,
+    0x34b0bcb5,
+    0x391c0cb3,
+    0x4ed8aa4a,
+    0x5b9cca4f,
+    0x682e6ff3,
+    0x748f82ee,
+    0x78a5636f,
+    0x84c87814,
+    0x8cc70208,
+    0x90befffa,
+    0xa4506ceb,
+    0xbef9a3f7,
+    0xc67178f2
 ]
+
+MAGIC_FRACTIONS_BITVECTOR_CUBE = [BitVector.mutable_from_int(value, SIZE_WORD) for value in MAGIC_FRACTIONS_CUBE]
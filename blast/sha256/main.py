@@ -1,21 +1,37 @@
 import math
 
 from blast.bitvector import BitVector
-from blast.sha256.constants import MAGIC_FRACTIONS_BITVECTOR_SQUARE
-from blast.sha256.functions import round_big, init_words
+from blast.cache import BitVectorCache
+from blast.sha256 import concrete
+from blast.sha256.constants import MAGIC_FRACTIONS_BITVECTOR_SQUARE, SIZE_WORD
+from blast.sha256.functions import round_big, init_words, word
+
+SIZE_BLOCK = 512
 
 
 class Sha256(object):
     """
     SHA256 implementation, implemented as described in the FIPS PUB 180-4 standard.
 
-    Operates on symbolic bitvectors.
+    Operates on symbolic bitvectors. Data may be fed incrementally through update(), blocks which are fully concrete
+    are compressed on integers into a concrete midstate such that only blocks carrying unknown bits form expressions.
+    An instance hashes a single message; once finalized, further calls to update() or finalize() raise a ValueError.
     """
 
     def __init__(self):
         self.digest = MAGIC_FRACTIONS_BITVECTOR_SQUARE[:]
+        self._buffer = BitVector([])
+        self._length = 0
+        self._finalized = False
 
     def _transform(self, data):
+        digest = BitVector.concatenate(*self.digest)
+        if data.is_concrete() and digest.is_concrete():
+            digest_words = [int(digest_word) for digest_word in self.digest]
+            digest_words = concrete.transform(digest_words, int(data))
+            self.digest = [BitVector.mutable_from_int(digest_word, SIZE_WORD) for digest_word in digest_words]
+            return
+
         w = init_words(data)
 
         ss = self.digest[:]
@@ -47,29 +63,64 @@ class Sha256(object):
         self.digest[7] = self.digest[7] + ss[7]
 
     @staticmethod
-    def pad(message):
+    def pad(message, length: int | None = None):
         """
         Pads the given message to create 512 bits of data, according to the SHA-256 standard.
 
         The message is padded with a 1 bit, followed by 0 bits, followed by 64 bits indicating message length
         making the total length of the message 512 bits.
+        :param message:
+        :param length: Length of the entire message in bits when only its tail is given, defaults to the given message's length.
         :return:
         """
         len_message = len(message)
-        len_padded = math.ceil((len_message + 1 + 64) / 512) * 512
+        len_padded = math.ceil((len_message + 1 + 64) / SIZE_BLOCK) * SIZE_BLOCK
         data = BitVector.mutable(len_padded)
         data[:len_message] = message
         data[len_message] = 1
         data[len_message + 1: len(data) - 64] = 0
-        data[len(data) - 64:] = BitVector.mutable_from_int(len_message, 64)
+        data[len(data) - 64:] = BitVector.mutable_from_int(len_message if length is None else length, 64)
         return data
 
-    def finalize(self, known_input: BitVector):
+    def update(self, data: BitVector) -> 'Sha256':
+        """
+        Feeds data into the hash, compressing every block which is completed by it.
+        :param data: Any known characteristics of the data encoded as a symbolic bitvector.
+        :return:
+        """
+        if self._finalized:
+            raise ValueError("Cannot update a finalized hash")
+        self._length += len(data)
+        buffer = BitVector.concatenate(self._buffer, data)
+        len_blocks = len(buffer) - len(buffer) % SIZE_BLOCK
+        for i in range(0, len_blocks, SIZE_BLOCK):
+            self._transform(buffer[i:i + SIZE_BLOCK])
+        self._buffer = buffer[len_blocks:]
+        return self
+
+    def _finalize(self, tail: BitVector) -> BitVector:
+        data = self.pad(tail, self._length)
+        for i in range(0, len(data), SIZE_BLOCK):
+            self._transform(data[i:i + SIZE_BLOCK])
+        return BitVector.concatenate(*self.digest)
+
+    def finalize(self, known_input: BitVector | None = None, cache: BitVectorCache | None = None):
         """
-        :param known_input: Any known characteristics of the input encoded as a symbolic bitvector with at least a known length.
+        :param known_input: Any known characteristics of the remaining input encoded as a symbolic bitvector with at least a known length.
+        :param cache: Cache from which to load the digest circuit when it was built before.
         :rtype: BitVector[]
         """
-        data = self.pad(known_input)
-        for i in range(0, len(data), 512):
-            self._transform(data[i:i + 512])
+        if known_input is not None:
+            self.update(known_input)
+        if self._finalized:
+            raise ValueError("Cannot finalize a finalized hash")
+        self._finalized = True
+        tail = self._buffer
+        self._buffer = BitVector([])
+        digest_initial = BitVector.concatenate(*self.digest)
+        if cache is None or not digest_initial.is_concrete():
+            self._finalize(tail)
+            return self.digest
+        digest = cache.build("sha256", tail, self._finalize, f"{int(digest_initial):x}", self._length)
+        self.digest = [digest[word(i)] for i in range(len(self.digest))]
         return self.digest
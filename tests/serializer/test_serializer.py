@@ -1,6 +1,7 @@
 from blast.bitvector import BitVector
 from blast.serialize.serializer import BitVectorSerializer, BitVectorDeserializer
 
+import io
 import math
 
 
@@ -44,3 +45,18 @@ def test_all(tmp_path_factory):
     serializer.serialize(bv0, temp_file.open("w"))
     bv1 = deserializer.deserialize(temp_file.open("r"))
     assert int(bv0) == int(bv1)
+
+
+def test_shared_bits():
+    bv0 = BitVector.mutable(2)
+    bv1 = BitVector.concatenate(bv0[0:1] ^ bv0[1:2], bv0, bv0)
+    stream = io.StringIO()
+    BitVectorSerializer.serialize(bv1, stream)
+    stream.seek(0)
+    bv2 = BitVectorDeserializer.deserialize(stream)
+    assert len(bv2) == 5
+    assert bv2.bit(1) is bv2.bit(3)
+    assert bv2.bit(2) is bv2.bit(4)
+    bv2.bit(1).assign(1)
+    bv2.bit(2).assign(0)
+    assert int(bv2) == 0b11010
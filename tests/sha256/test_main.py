@@ -1,3 +1,9 @@
+import hashlib
+
+import pytest
+
+from blast import graph
+from blast.bit import Reference
 from blast.bitvector import BitVector
 from blast.sha256.main import Sha256
 
@@ -34,3 +40,43 @@ def test_all():
     assert int(digest_long[5]) == 0x64ff2167
     assert int(digest_long[6]) == 0xf6ecedd4
     assert int(digest_long[7]) == 0x19db06c1
+
+
+def test_update():
+    message = b"The quick brown fox jumps over the lazy dog, twice: the quick brown fox jumps over the lazy dog"
+    message_bitvector = BitVector.mutable_from_int(int.from_bytes(message, "big"), 8 * len(message))
+    digest = Sha256().update(message_bitvector[:100]).update(message_bitvector[100:]).finalize()
+    expected = hashlib.sha256(message).digest()
+    for i in range(8):
+        assert int(digest[i]) == int.from_bytes(expected[i * 4:i * 4 + 4], "big")
+
+
+def test_update_symbolic_tail():
+    message = b"The quick brown fox jumps over the lazy dog, twice: the quick brown fox jumps over the lazy dog"
+    prefix = BitVector.mutable_from_int(int.from_bytes(message[:-1], "big"), 8 * (len(message) - 1))
+    suffix = BitVector.mutable(8)
+    digest = BitVector.concatenate(*Sha256().update(prefix).finalize(suffix))
+    for i in range(8):
+        suffix.bit(i).assign((message[-1] >> (7 - i)) & 1)
+    assert int(digest) == int.from_bytes(hashlib.sha256(message).digest(), "big")
+
+
+def test_update_prefix_length():
+    suffix = BitVector.mutable(8)
+    digest_short = Sha256().update(BitVector.mutable_from_int(0, 1024)).finalize(suffix)
+    digest_long = Sha256().update(BitVector.mutable_from_int(0, 4096)).finalize(suffix)
+    bits_short = BitVector.concatenate(*digest_short)
+    bits_long = BitVector.concatenate(*digest_long)
+    nodes_short = graph.topological([bits_short.bit(i) for i in range(len(bits_short))])
+    nodes_long = graph.topological([bits_long.bit(i) for i in range(len(bits_long))])
+    assert len(nodes_short) == len(nodes_long)
+    assert {Reference(bit) for bit in graph.inputs(nodes_long)} == {Reference(suffix.bit(i)) for i in range(8)}
+
+
+def test_finalized():
+    sha256 = Sha256()
+    sha256.finalize(BitVector.mutable_from_int(0x616263, 24))
+    with pytest.raises(ValueError):
+        sha256.update(BitVector.mutable_from_int(0x64, 8))
+    with pytest.raises(ValueError):
+        sha256.finalize()
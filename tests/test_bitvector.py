@@ -56,3 +56,15 @@ def test_all():
     assert int((bitvector_0xffffff >> 2)) == 0x3fffff
     assert int((bitvector_0xffffff >> 3)) == 0x1fffff
     assert int((bitvector_0xffffff >> 4)) == 0x0fffff
+
+
+def test_add_symbolic():
+    a = BitVector.mutable(bit_len(1))
+    b = BitVector.mutable(bit_len(1))
+    total = a + b
+    for value_a, value_b in [(0x3c, 0x0f), (0xff, 0x01), (0x80, 0x80), (0x55, 0xaa), (0x01, 0x7f)]:
+        for i in range(bit_len(1)):
+            a.bit(i).assign((value_a >> (bit_len(1) - 1 - i)) & 1)
+            b.bit(i).assign((value_b >> (bit_len(1) - 1 - i)) & 1)
+        assert int(total) == (value_a + value_b) & 0xff
+        assert int(total) == int(BitVector.mutable_from_int(value_a, bit_len(1)) + BitVector.mutable_from_int(value_b, bit_len(1)))
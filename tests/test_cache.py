@@ -0,0 +1,106 @@
+import hashlib
+import os
+import time
+
+from blast.bitvector import BitVector
+from blast.cache import BitVectorCache, CACHE_SKIP
+from blast.sha256.functions import gamma0
+from blast.sha256.main import Sha256
+
+
+def slow(build):
+    def build_slow(source: BitVector) -> BitVector:
+        time.sleep(0.05)
+        return build(source)
+
+    return build_slow
+
+
+def test_key():
+    source_unknown = BitVector.mutable(8)
+    source_known = BitVector.mutable(8)
+    source_known[0:4] = 0b1010
+    assert BitVectorCache.key("gamma0", source_unknown) == BitVectorCache.key("gamma0", BitVector.mutable(8))
+    assert BitVectorCache.key("gamma0", source_unknown) != BitVectorCache.key("gamma1", source_unknown)
+    assert BitVectorCache.key("gamma0", source_unknown) != BitVectorCache.key("gamma0", source_known)
+    assert BitVectorCache.key("gamma0", source_unknown) != BitVectorCache.key("gamma0", BitVector.mutable(9))
+    assert BitVectorCache.key("gamma0", source_unknown ^ source_known) is None
+
+    # aliasing between unknown bits
+    x = BitVector.mutable(4)
+    assert BitVectorCache.key("xor", BitVector.concatenate(x, x)) != BitVectorCache.key("xor", BitVector.mutable(8))
+
+
+def test_build(tmp_path):
+    cache = BitVectorCache(str(tmp_path))
+    built = cache.build("gamma0", BitVector.mutable(32), slow(gamma0))
+    assert cache.usage()[0] == 1
+
+    source = BitVector.mutable(32)
+    loaded = cache.build("gamma0", source, lambda _: None)
+    for i in range(32):
+        source.bit(i).assign((0x12345678 >> (31 - i)) & 1)
+    assert len(loaded) == len(built)
+    assert int(loaded) == int(gamma0(BitVector.mutable_from_int(0x12345678, 32)))
+
+
+def test_build_aliased(tmp_path):
+    def xor_halves(source: BitVector) -> BitVector:
+        return source[0:1] ^ source[1:2]
+
+    cache = BitVectorCache(str(tmp_path))
+    x = BitVector.mutable(1)
+    cache.build("xor", BitVector.concatenate(x, x), slow(xor_halves))
+    a = BitVector.mutable(1)
+    b = BitVector.mutable(1)
+    loaded = cache.build("xor", BitVector.concatenate(a, b), slow(xor_halves))
+    a.bit(0).assign(1)
+    b.bit(0).assign(0)
+    assert int(loaded) == 1
+
+
+def test_build_skip(tmp_path):
+    cache = BitVectorCache(str(tmp_path))
+    source = BitVector.mutable(32)
+    cache.build("gamma0", source, gamma0)
+    assert cache.get(BitVectorCache.key("gamma0", source)) == CACHE_SKIP
+    rebuilt = cache.build("gamma0", source, gamma0)
+    for i in range(32):
+        source.bit(i).assign((0x12345678 >> (31 - i)) & 1)
+    assert int(rebuilt) == int(gamma0(BitVector.mutable_from_int(0x12345678, 32)))
+
+
+def test_sha256(tmp_path):
+    cache = BitVectorCache(str(tmp_path))
+    digest_built = Sha256().finalize(BitVector.mutable_from_int(0x616263, 24), cache)
+    digest_loaded = Sha256().finalize(BitVector.mutable_from_int(0x616263, 24), cache)
+    assert int(digest_built[0]) == int(digest_loaded[0]) == 0xba7816bf
+    assert int(digest_built[7]) == int(digest_loaded[7]) == 0xf20015ad
+    assert cache.usage()[0] == 1
+
+
+def test_sha256_symbolic(tmp_path):
+    cache = BitVectorCache(str(tmp_path))
+    Sha256().finalize(BitVector.mutable(4), cache)
+    suffix = BitVector.mutable(4)
+    digest = BitVector.concatenate(*Sha256().update(BitVector.mutable_from_int(0x616, 12)).finalize(suffix, cache))
+    for i in range(4):
+        suffix.bit(i).assign((0x3 >> (3 - i)) & 1)
+    assert int(digest) == int.from_bytes(hashlib.sha256(b"ac").digest(), "big")
+
+
+def test_evict(tmp_path):
+    cache = BitVectorCache(str(tmp_path), size=0)
+    cache.put("a", "a")
+    assert cache.usage() == (0, 0)
+
+    cache = BitVectorCache(str(tmp_path))
+    cache.put("a", "a")
+    cache.put("b", "b")
+    os.utime(os.path.join(str(tmp_path), "a.flat"), ns=(0, 0))
+    cache.size = 1
+    cache.evict()
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+    cache.clear()
+    assert cache.usage() == (0, 0)